@@ -1,13 +1,45 @@
-from fastapi import APIRouter, HTTPException, status, Query
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
 import httpx
 from app.models.pokemon import (
     PokemonListResponse,
     PokemonCreate,
     PokemonResponse,
 )
+from app.services.admission import Deadline, admission_controller
 from app.services.pokemon_service import pokemon_service
 
-router = APIRouter(prefix="/pokemons", tags=["pokemons"])
+
+def get_deadline(
+    x_request_timeout: Optional[float] = Header(
+        None,
+        gt=0,
+        description="Deadline budget in seconds, capped at the server default",
+    ),
+) -> Deadline:
+    """Start the deadline for the current request."""
+    return admission_controller.new_deadline(x_request_timeout)
+
+
+async def admit_request(deadline: Deadline = Depends(get_deadline)):
+    """Hold a processing slot for the request or reject it with 503."""
+    controller = admission_controller
+    if not await controller.acquire(timeout=deadline.remaining()):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is overloaded, please retry later",
+            headers={"Retry-After": str(controller.retry_after)},
+        )
+    try:
+        yield
+    finally:
+        controller.release()
+
+
+router = APIRouter(
+    prefix="/pokemons", tags=["pokemons"], dependencies=[Depends(admit_request)]
+)
 
 
 @router.get(
@@ -20,6 +52,7 @@ router = APIRouter(prefix="/pokemons", tags=["pokemons"])
 async def get_all_pokemons(
     limit: int = Query(20, ge=1, le=100, description="Number of pokemons to fetch"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    deadline: Deadline = Depends(get_deadline),
 ):
     """
     List all pokemons from PokeAPI.
@@ -27,8 +60,19 @@ async def get_all_pokemons(
     - **limit**: Number of pokemons to fetch (1-100)
     - **offset**: Offset for pagination
     """
+    remaining = deadline.remaining()
     try:
-        return await pokemon_service.get_all_pokemons(limit=limit, offset=offset)
+        return await asyncio.wait_for(
+            pokemon_service.get_all_pokemons(
+                limit=limit, offset=offset, timeout=remaining
+            ),
+            timeout=remaining,
+        )
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Request deadline exceeded while fetching pokemons",
+        )
     except httpx.HTTPError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -48,7 +92,9 @@ async def get_all_pokemons(
     summary="Get pokemon by ID",
     description="Fetch a specific pokemon by its ID from PokeAPI or local storage.",
 )
-async def get_pokemon_by_id(pokemon_id: int):
+async def get_pokemon_by_id(
+    pokemon_id: int, deadline: Deadline = Depends(get_deadline)
+):
     """
     Get a specific pokemon by ID.
 
@@ -56,8 +102,12 @@ async def get_pokemon_by_id(pokemon_id: int):
       - IDs 1-10000: Fetched from PokeAPI
       - IDs 10001+: Fetched from local storage
     """
+    remaining = deadline.remaining()
     try:
-        pokemon = await pokemon_service.get_pokemon_by_id(pokemon_id)
+        pokemon = await asyncio.wait_for(
+            pokemon_service.get_pokemon_by_id(pokemon_id, timeout=remaining),
+            timeout=remaining,
+        )
         if not pokemon:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -66,6 +116,11 @@ async def get_pokemon_by_id(pokemon_id: int):
         return pokemon
     except HTTPException:
         raise
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Request deadline exceeded while fetching pokemon {pokemon_id}",
+        )
     except httpx.HTTPError as e:
         if hasattr(e, "response") and e.response.status_code == 404:
             raise HTTPException(
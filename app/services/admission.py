@@ -0,0 +1,115 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Time budget for a single request, measured on the monotonic clock."""
+
+    def __init__(self, budget: float):
+        """
+        Start a deadline that expires ``budget`` seconds from now.
+
+        Args:
+            budget: Number of seconds the request is allowed to take
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline, never below zero."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the request has used up its whole budget."""
+        return self.remaining() <= 0
+
+
+class AdmissionController:
+    """Bounds concurrent work so that excess requests are rejected early."""
+
+    DEFAULT_DEADLINE = float(os.getenv("POKEMON_API_DEADLINE_SECONDS", "10"))
+    MAX_IN_FLIGHT = int(os.getenv("POKEMON_API_MAX_IN_FLIGHT", "100"))
+    MAX_QUEUE_WAIT = float(os.getenv("POKEMON_API_MAX_QUEUE_WAIT_SECONDS", "0.5"))
+    RETRY_AFTER = int(os.getenv("POKEMON_API_RETRY_AFTER_SECONDS", "1"))
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_queue_wait: Optional[float] = None,
+        default_deadline: Optional[float] = None,
+        retry_after: Optional[int] = None,
+    ):
+        """
+        Initialize the controller, falling back to the environment settings.
+
+        Args:
+            max_in_flight: Maximum number of requests processed at once
+            max_queue_wait: Maximum seconds a request may wait for a free slot
+            default_deadline: Deadline budget in seconds for each request
+            retry_after: Seconds suggested to rejected clients before retrying
+        """
+        self.max_in_flight = (
+            self.MAX_IN_FLIGHT if max_in_flight is None else max_in_flight
+        )
+        self.max_queue_wait = (
+            self.MAX_QUEUE_WAIT if max_queue_wait is None else max_queue_wait
+        )
+        self.default_deadline = (
+            self.DEFAULT_DEADLINE if default_deadline is None else default_deadline
+        )
+        self.retry_after = self.RETRY_AFTER if retry_after is None else retry_after
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    def new_deadline(self, requested: Optional[float] = None) -> Deadline:
+        """
+        Create the deadline for an incoming request.
+
+        Args:
+            requested: Budget asked for by the client, in seconds
+
+        Returns:
+            Deadline capped at the configured default budget
+        """
+        if requested is None:
+            return Deadline(self.default_deadline)
+        return Deadline(min(requested, self.default_deadline))
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Try to take a processing slot.
+
+        Args:
+            timeout: Upper bound in seconds on the queue wait, e.g. the time
+                left on the request deadline
+
+        Returns:
+            True if a slot was taken, False if the request should be shed
+        """
+        wait = self.max_queue_wait
+        if timeout is not None:
+            wait = min(wait, timeout)
+
+        if not self._slots.locked():
+            await self._slots.acquire()
+        elif wait <= 0:
+            return False
+        else:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=wait)
+            except asyncio.TimeoutError:
+                return False
+
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        """Give back a slot taken by a successful ``acquire``."""
+        self.in_flight -= 1
+        self._slots.release()
+
+
+admission_controller = AdmissionController()
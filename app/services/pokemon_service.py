@@ -11,6 +11,7 @@ class PokemonService:
     """Service for interacting with PokeAPI and managing local pokemons."""
 
     BASE_URL = "https://pokeapi.co/api/v2"
+    DEFAULT_TIMEOUT = 5.0
 
     def __init__(self):
         """Initialize the Pokemon service with local storage."""
@@ -18,7 +19,7 @@ class PokemonService:
         self.next_id = 10001
 
     async def get_all_pokemons(
-        self, limit: int = 20, offset: int = 0
+        self, limit: int = 20, offset: int = 0, timeout: Optional[float] = None
     ) -> PokemonListResponse:
         """
         Fetch list of all pokemons from PokeAPI.
@@ -26,6 +27,7 @@ class PokemonService:
         Args:
             limit: Number of pokemons to fetch
             offset: Offset for pagination
+            timeout: Seconds allowed for the upstream request
 
         Returns:
             PokemonListResponse with list of pokemons
@@ -33,19 +35,22 @@ class PokemonService:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(timeout=self._timeout(timeout)) as client:
             response = await client.get(
                 f"{self.BASE_URL}/pokemon", params={"limit": limit, "offset": offset}
             )
             response.raise_for_status()
             return PokemonListResponse(**response.json())
 
-    async def get_pokemon_by_id(self, pokemon_id: int) -> Optional[PokemonResponse]:
+    async def get_pokemon_by_id(
+        self, pokemon_id: int, timeout: Optional[float] = None
+    ) -> Optional[PokemonResponse]:
         """
         Fetch specific pokemon by ID from PokeAPI or local storage.
 
         Args:
             pokemon_id: ID of the pokemon to fetch
+            timeout: Seconds allowed for the upstream request
 
         Returns:
             PokemonResponse if found, None otherwise
@@ -58,7 +63,7 @@ class PokemonService:
             return self.local_pokemons.get(pokemon_id)
 
         # Fetch from PokeAPI
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(timeout=self._timeout(timeout)) as client:
             response = await client.get(f"{self.BASE_URL}/pokemon/{pokemon_id}")
             response.raise_for_status()
             pokemon_data = response.json()
@@ -73,6 +78,10 @@ class PokemonService:
                 sprites=pokemon_data.get("sprites"),
             )
 
+    def _timeout(self, timeout: Optional[float]) -> float:
+        """Return the upstream timeout to use, defaulting when none is given."""
+        return self.DEFAULT_TIMEOUT if timeout is None else timeout
+
     def create_pokemon(self, pokemon_data: PokemonCreate) -> PokemonResponse:
         """
         Create a new pokemon and store it locally.
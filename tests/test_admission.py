@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from app.services.admission import AdmissionController
+
+
+class TestDeadline:
+    """Test suite for request deadlines."""
+
+    def test_new_deadline_uses_default_budget(self):
+        """Test that a deadline without a client budget uses the default."""
+        controller = AdmissionController(default_deadline=10)
+
+        deadline = controller.new_deadline()
+
+        assert deadline.budget == 10
+        assert 9 < deadline.remaining() <= 10
+        assert not deadline.expired
+
+    def test_new_deadline_is_capped_at_default(self):
+        """Test that a client cannot ask for more than the default budget."""
+        controller = AdmissionController(default_deadline=10)
+
+        assert controller.new_deadline(2).budget == 2
+        assert controller.new_deadline(60).budget == 10
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController class."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_and_release(self):
+        """Test that slots are counted while requests are in flight."""
+        controller = AdmissionController(max_in_flight=2, max_queue_wait=0)
+
+        assert await controller.acquire()
+        assert await controller.acquire()
+        assert controller.in_flight == 2
+
+        controller.release()
+        assert controller.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_rejects_when_full(self):
+        """Test that requests are shed once the in-flight limit is reached."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=0)
+
+        assert await controller.acquire()
+        assert not await controller.acquire()
+        assert controller.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_rejects_after_queue_wait(self):
+        """Test that a queued request gives up after the maximum queue wait."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=0.01)
+
+        assert await controller.acquire()
+        assert not await controller.acquire()
+
+    @pytest.mark.asyncio
+    async def test_queued_request_gets_released_slot(self):
+        """Test that a queued request is admitted when a slot frees up."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=1)
+        assert await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        controller.release()
+
+        assert await waiter
+        assert controller.in_flight == 1
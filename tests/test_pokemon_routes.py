@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, Mock
 import httpx
 from fastapi import status
+from app.services.admission import AdmissionController
 
 
 class TestGetAllPokemons:
@@ -134,3 +135,65 @@ class TestPokemonIntegration:
         assert retrieved_pokemon["id"] == created_pokemon["id"]
         assert retrieved_pokemon["name"] == created_pokemon["name"]
         assert retrieved_pokemon["types"] == created_pokemon["types"]
+
+
+class TestDeadlineAndLoadShedding:
+    """Test suite for request deadlines and admission control."""
+
+    def test_deadline_header_propagated_to_service(
+        self, client, mock_pokemon_list_response, reset_pokemon_service
+    ):
+        """Test that the client deadline bounds the upstream timeout."""
+        with patch(
+            "app.routes.pokemon_routes.pokemon_service.get_all_pokemons"
+        ) as mock_get_all:
+            mock_get_all.return_value = mock_pokemon_list_response
+
+            response = client.get("/pokemons", headers={"X-Request-Timeout": "2"})
+
+            assert response.status_code == status.HTTP_200_OK
+            timeout = mock_get_all.call_args.kwargs["timeout"]
+            assert 0 < timeout <= 2
+
+    def test_invalid_deadline_header(self, client, reset_pokemon_service):
+        """Test validation failure for a non-positive deadline header."""
+        response = client.get("/pokemons", headers={"X-Request-Timeout": "0"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_upstream_timeout_returns_gateway_timeout(
+        self, client, reset_pokemon_service
+    ):
+        """Test that an upstream timeout is reported as 504."""
+        with patch("httpx.AsyncClient.get") as mock_get:
+            mock_get.side_effect = httpx.ReadTimeout("timed out")
+
+            response = client.get("/pokemons/1")
+
+            assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+            assert "deadline exceeded" in response.json()["detail"]
+
+    def test_overloaded_server_sheds_request(self, client, reset_pokemon_service):
+        """Test that requests are rejected with Retry-After when full."""
+        controller = AdmissionController(
+            max_in_flight=0, max_queue_wait=0, retry_after=3
+        )
+        with patch("app.routes.pokemon_routes.admission_controller", controller):
+            response = client.get("/pokemons")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "3"
+        assert "overloaded" in response.json()["detail"]
+
+    def test_slot_released_after_request(
+        self, client, valid_pokemon_create_data, reset_pokemon_service
+    ):
+        """Test that a finished request frees its processing slot."""
+        controller = AdmissionController(max_in_flight=1, max_queue_wait=0)
+        with patch("app.routes.pokemon_routes.admission_controller", controller):
+            first = client.post("/pokemons", json=valid_pokemon_create_data)
+            second = client.post("/pokemons", json=valid_pokemon_create_data)
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_201_CREATED
+        assert controller.in_flight == 0